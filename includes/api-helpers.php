@@ -139,6 +139,37 @@ function getEvtProdDataFile($data) {
 }
 
 
+// Send caching headers and answer conditional requests without reading the
+// input file, it only changes when the Event Producer regenerates it
+function sendCacheHeaders($dataFilePath, $data) {
+  $lastModified = filemtime($dataFilePath);
+  if ($lastModified === false) {
+    return;
+  }
+
+  $etag = '"' . md5(implode('|', $data) . '|' . $lastModified) . '"';
+  header('Cache-Control: public, max-age=300');
+  header('ETag: ' . $etag);
+  header('Last-Modified: ' . gmdate('D, d M Y H:i:s', $lastModified) . ' GMT');
+
+  if (!isset($_SERVER['HTTP_IF_NONE_MATCH'])) {
+    return;
+  }
+
+  // Clients may send several tags or weak ones
+  foreach (explode(',', $_SERVER['HTTP_IF_NONE_MATCH']) as $tag) {
+    $tag = trim($tag);
+    if (strpos($tag, 'W/') === 0) {
+      $tag = substr($tag, 2);
+    }
+    if ($tag === $etag || $tag === '*') {
+      http_response_code(304);
+      exit();
+    }
+  }
+}
+
+
 // Get samples array produced by Event Producer
 function getEvtProdPSampleArray($dataFilePath, &$data) {
   $colNames = array();
@@ -164,16 +195,19 @@ function getEvtProdPSampleArray($dataFilePath, &$data) {
                       'vavolkl');
   }
 
-  $txt_file = file_get_contents($dataFilePath);
   $data['last-update'] = filemtime($dataFilePath);
 
-  $rows = explode("\n", $txt_file);
-
   $samples = array();
   $nColsExpected = count($colNames);
-  foreach($rows as $rowId => $row) {
+
+  // Read the file row by row instead of loading it whole
+  $dataFile = fopen($dataFilePath, 'r');
+  if ($dataFile === false) {
+    return $samples;
+  }
+  while (($row = fgets($dataFile)) !== false) {
     // get row items
-    $rowItems = explode(',,', $row);
+    $rowItems = explode(',,', rtrim($row, "\n"));
     $nCols = count($rowItems);
 
     // Exclude total row
@@ -194,6 +228,7 @@ function getEvtProdPSampleArray($dataFilePath, &$data) {
       $samples[$rowItems[0]][$colNames[$i]] = $rowItems[$i] ?? '';
     }
   }
+  fclose($dataFile);
 
   return $samples;
 }
@@ -50,27 +50,18 @@
         '</div>');
   }
 
-  // Total info
-  $ret = $sampleDB->query('SELECT SUM("n-events"), SUM("n-files-good"), ' .
-                          'SUM("n-files-bad"), SUM("n-files-eos"), ' .
-                          'SUM("size"), SUM("sum-of-weights") ' .
-                          'FROM sample WHERE ' . $queryBase);
-  if (!$ret) {
-    die('<div class="alert alert-danger" role="alert">' .
-        'ERROR: Database error occurred:<br>' .
-        $sampleDB->lastErrorMsg() .
-        '<br>Please contact site administration.' .
-        '</div>'
-    );
-  }
-  while($row = $ret->fetchArray(SQLITE3_ASSOC)) {
-    $totalInfo['n-events'] = $row['SUM("n-events")'] ?? -1;
-    $totalInfo['n-files-good'] = $row['SUM("n-files-good")'] ?? -1;
-    $totalInfo['n-files-bad'] = $row['SUM("n-files-bad")'] ?? -1;
-    $totalInfo['n-files-eos'] = $row['SUM("n-files-eos")'] ?? -1;
-    $totalInfo['size'] = $row['SUM("size")'] ?? -1;
-    $totalInfo['sum-of-weights'] = $row['SUM("sum-of-weights")'] ?? -1;
-    break;
+  // Total info, summed from the already fetched samples, NULL values are
+  // skipped like in SQL SUM()
+  $totalColNames = array('n-events', 'n-files-good', 'n-files-bad',
+                         'n-files-eos', 'size', 'sum-of-weights');
+  foreach ($totalColNames as $colName) {
+    $total = null;
+    foreach ($samples as $sample) {
+      if (isset($sample[$colName])) {
+        $total += $sample[$colName];
+      }
+    }
+    $totalInfo[$colName] = $total ?? -1;
   }
 
   // Stacks
@@ -111,27 +102,28 @@
                               'name' => $row['name']];
   }
   foreach ($samples as $sampleId => &$sample) {
-    $producerSampleLinks = array();
-    $ret = $sampleDB->query('SELECT * FROM producersamplelink WHERE ' .
-                            '"sample_id" = "' . $sampleId . '";');
-    if (!$ret) {
-      die('<div class="alert alert-danger" role="alert">' .
-          'ERROR: Database error occurred:<br>' .
-          $sampleDB->lastErrorMsg() .
-          '<br>Please contact site administration.' .
-          '</div>'
-      );
-    }
     $sample['produced-by'] = array();
-    while($row = $ret->fetchArray(SQLITE3_ASSOC)) {
-      $producer = $producers[$row['producer_id']];
-      $sample['produced-by'][] = ['username' => $producer['username'],
-                                  'name' => $producer['name']];
-    }
+  }
+  unset($sample);
+  // Links of all selected samples are fetched at once
+  $ret = $sampleDB->query('SELECT * FROM producersamplelink WHERE ' .
+                          '"sample_id" IN (' . implode(', ', array_keys($samples)) . ') ' .
+                          'ORDER BY "sample_id", "producer_id";');
+  if (!$ret) {
+    die('<div class="alert alert-danger" role="alert">' .
+        'ERROR: Database error occurred:<br>' .
+        $sampleDB->lastErrorMsg() .
+        '<br>Please contact site administration.' .
+        '</div>'
+    );
+  }
+  while($row = $ret->fetchArray(SQLITE3_ASSOC)) {
+    $producer = $producers[$row['producer_id']];
+    $samples[$row['sample_id']]['produced-by'][] = ['username' => $producer['username'],
+                                                    'name' => $producer['name']];
   }
   // print_r($producers);
   unset($producers);
-  unset($sample);
 
   // echo "<pre>";
   // print_r($samples);
@@ -12,6 +12,9 @@ $data = parseQueryString();
 // Decide which input file to search
 $dataFilePath = getEvtProdDataFile($data);
 
+// Skip the search if the client already has the current response
+sendCacheHeaders($dataFilePath, $data);
+
 // Search input file
 $samples = getEvtProdPSampleArray($dataFilePath, $data);
 
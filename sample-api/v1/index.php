@@ -10,5 +10,7 @@ $response = array(
 );
 
 header('Content-Type: application/json; charset=utf-8');
+// Same max-age as the sample location endpoints
+header('Cache-Control: public, max-age=300');
 echo json_encode($response);
 ?>